@@ -1,15 +1,17 @@
 import random
 import datetime
 
-sum = 0
+rng = random.Random()
+DOUBLED = (0,2,4,6,8,1,3,5,7,9)
+DIGITS = bytes.maketrans(b"0123456789", bytes(range(10)))
+
 card = input("bin:")
-current_time = datetime.datetime.now()
 
 #
 #verify if card has 6 characters
 #
 
-while card.isdigit() != True or len(card) != 6 :
+while not (card.isascii() and card.isdigit()) or len(card) != 6 :
         print("bin error")
         card = input("bin(6 numbers):")
 
@@ -17,50 +19,33 @@ while card.isdigit() != True or len(card) != 6 :
 #generate card
 #
 
-for i in range(6):
-        if i%2 == 0:
-                y=int(card[i])*2
-                if y >= 10:
-                        y = y%10+1
-                sum += y
-        else:
-                sum += int(card[i])
+card = card + "%09d" % rng.randrange(10**9)
 
-for i in range(9):
-        x = random.randint(0,9)
-        if i%2 == 0:
-                y = x*2
-                if y >= 10:
-                        y = y%10+1
-                sum += y
-        else:
-                sum += x
-        card = card + str(x)
-sum *= 9
+digits = card.encode("ascii").translate(DIGITS)
+total = sum(DOUBLED[d] for d in digits[0::2]) + sum(digits[1::2])
 
-card = card + str(sum%10)
+card = card + str(total*9%10)
 print("card:" + card)
 
 #
 #generate bin, year and month
 #
 
-cvv = random.randint(0,999)
-if cvv <= 9:
-    cvv = "00" + str(cvv)
-elif cvv <= 99:
-    cvv="0" + str(cvv)
-month = random.randint(1,12)
+current_time = datetime.datetime.now()
+current_year = current_time.year%100
+current_month = current_time.month
 
-year = random.randint(22,26)
+cvv = "%03d" % rng.randint(0,999)
+r = rng.getrandbits(32)
+month = (r & 0xffff)%12 + 1
+year = (r >> 16)%5 + current_year
 
-while current_time.year%100 == year and current_time.month > month :
-    month = random.randint(1,12)
+while current_year == year and current_month > month :
+    month = rng.randint(1,12)
 
-if month <= 9:
-        month = "0" + str(month)
+month = "%02d" % month
 
 
-print("cvv" + str(cvv))
-print("month:" + str(month))
+print("cvv" + cvv)
+print("month:" + month)
 print("year:" + str(year))